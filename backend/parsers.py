@@ -1,167 +1,348 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+"""Statement field extraction for credit card PDFs.
+
+Performance note: this module's hot path is CPU-bound in the regex
+engine. Text arrives pre-extracted (PDF decoding happens in
+pdf_extract), so a parse is pure pattern matching over tens of KB of
+statement text. That is why the patterns are precompiled and fused into
+single-pass alternations, case folding is done once on the text instead
+of per scan, and repeated scans of the same text are memoized - the
+wins here come from cutting passes over the text and per-match Python
+overhead, not from I/O. Heavier machinery (DFA engine swaps, JIT
+compilation, GPU offload) is not justified at these text sizes.
+"""
+from abc import ABC
+from functools import lru_cache
+from typing import Dict, Any
 import re
-import pdfplumber
-import io
-from datetime import datetime
+
+
+# All extractor patterns are compiled once at import. Rebuilding the pattern
+# lists per call re-parsed every pattern through the re module's internal
+# cache lookup on each parse; across all extractor families that cache churn
+# is pure overhead on the hottest path in the module.
+
+
+class _FusedPatterns:
+    """A pattern family compiled into one alternation, scanned in one pass.
+
+    Searching each family pattern separately re-walks the full statement
+    text once per pattern. Fusing them lets a single finditer pass collect
+    the first match of every alternative at once. The alternation sits
+    inside a lookahead so matches stay non-consuming - one alternative
+    matching can't swallow text that another alternative (possibly a
+    higher-priority one) also needs. Selection still honours the family's
+    declaration order (a later-listed pattern never beats an earlier
+    one), matching the old first-pattern-wins loop.
+
+    All pattern literals are written lowercase and compiled without
+    re.IGNORECASE; callers lowercase the text once instead of making the
+    engine case-fold every byte on every scan.
+    """
+
+    def __init__(self, patterns):
+        parts = []
+        spans = []  # (wrapper group number, capture count) per pattern
+        group_number = 1
+        for i, pattern in enumerate(patterns):
+            parts.append("(?P<f%d>%s)" % (i, pattern))
+            captures = re.compile(pattern).groups
+            spans.append((group_number, captures))
+            group_number += 1 + captures
+        self._spans = tuple(spans)
+        self._count = len(parts)
+        self._regex = re.compile("(?=" + "|".join(parts) + ")")
+
+    def first_matches(self, text: str) -> Dict[int, tuple]:
+        """Map each pattern index to the captures of its first match"""
+        found = {}
+        for match in self._regex.finditer(text):
+            for i, (wrapper, captures) in enumerate(self._spans):
+                if i not in found and match.group(wrapper) is not None:
+                    groups = range(wrapper + 1, wrapper + 1 + captures)
+                    found[i] = tuple(match.group(g) for g in groups)
+                    break
+            if len(found) == self._count:
+                break
+        return found
+
+
+def _pick_capture(found: Dict[int, tuple]) -> str:
+    """First capture of the highest-priority pattern found, or None"""
+    if not found:
+        return None
+    return found[min(found)][0]
+
+
+def _format_inr(raw: str) -> str:
+    """Format a captured amount as ₹x,xxx.xx without a float round-trip.
+
+    Captures are digits and commas with at most one decimal point, so the
+    output can be rebuilt with string slicing. Anything surprising (empty
+    integer part, over-long fraction that needs rounding) falls back to
+    the float formatter, which raises ValueError for garbage exactly like
+    the old code path.
+    """
+    amount = raw.replace(',', '').replace(' ', '')
+    dot = amount.find('.')
+    int_part = amount[:dot] if dot >= 0 else amount
+    frac = amount[dot + 1:] if dot >= 0 else ''
+    if int_part.isdigit() and len(frac) <= 2 and (not frac or frac.isdigit()):
+        int_part = int_part.lstrip('0') or '0'
+        groups = []
+        while len(int_part) > 3:
+            groups.append(int_part[-3:])
+            int_part = int_part[:-3]
+        groups.append(int_part)
+        return "₹" + ",".join(reversed(groups)) + "." + frac.ljust(2, '0')
+    return f"₹{float(amount):,.2f}"
+
+
+def _pick_amount(found: Dict[int, tuple]) -> str:
+    """Highest-priority amount capture formatted as ₹, or None.
+
+    Mirrors the old pattern loop: an unparseable capture falls through to
+    the next pattern in priority order.
+    """
+    for i in sorted(found):
+        try:
+            return _format_inr(found[i][0])
+        except ValueError:
+            continue
+    return None
+
+
+# Card last-4: ****1234, xxxx1234, ending in 1234, card number ending 1234
+_LAST4_PATTERNS = (
+    r'\*\*\*\*\s*(\d{4})',
+    r'xxxx\s*(\d{4})',
+    r'ending\s+in\s+(\d{4})',
+    r'card\s+ending\s+(\d{4})',
+    r'card\s+number\s+ending\s+(\d{4})',
+    r'(\d{4})\s*ending',
+    r'\b(\d{4})\s*(?:ending|expires)',
+    r'card\s+no[.:]\s*[x*]+\s*(\d{4})',
+    r'[x*]{8,}\s*(\d{4})',  # Multiple x or * followed by 4 digits
+    # Lower-priority fallbacks: full card number like 1234 5678 9012 3456,
+    # then any card/account context trailed by 4 digits (Indian format)
+    r'\b\d{4}\s+\d{4}\s+\d{4}\s+(\d{4})\b',
+    r'(?:card|account).*?[-x*\s]+(\d{4})\b',
+)
+
+# Billing cycle - supporting both US and Indian date formats
+_BILLING_PATTERNS = (
+    r'billing\s+period[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'statement\s+period[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'billing\s+cycle[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+through\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+-\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',  # Dash separator
+    r'from\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'period[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+)
+
+_DUE_DATE_PATTERNS = (
+    r'payment\s+due\s+date[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'due\s+date[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'minimum\s+payment\s+due\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'pay\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'payment\s+due\s+on[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'payable\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'payable\s+on\s+or\s+before[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+    r'due\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
+)
+
+# Balance/amount due - supports both ₹ and $, Indian formats
+_BALANCE_PATTERNS = (
+    r'total\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'new\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'current\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'outstanding\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'amount\s+due[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'total\s+amount\s+due[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'outstanding\s+amount[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'balance\s+amount[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'₹\s*([\d,]+\.?\d*)',  # Just ₹ symbol followed by amount
+    r'rupees?\s*([\d,]+\.?\d*)',  # Indian: "Rupees" or "Rupee"
+    r'rs\.?\s*([\d,]+\.?\d*)',  # Indian: "Rs." or "Rs"
+    r'inr\s*([\d,]+\.?\d*)',  # INR currency code
+)
+
+_COUNT_PATTERNS = (
+    r'(\d+)\s+transactions?',
+    r'total\s+transactions?[:\s]+(\d+)',
+    r'number\s+of\s+transactions?[:\s]+(\d+)',
+    r'transaction\s+count[:\s]+(\d+)',
+    r'no\.?\s+of\s+transactions?[:\s]+(\d+)',  # Indian: "No. of transactions"
+)
+
+# Total charges - supports both ₹ and $
+_CHARGE_PATTERNS = (
+    r'total\s+charges?[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'total\s+purchases?[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'total\s+spend[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'total\s+debits?[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'total\s+spending[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'charges?\s+this\s+period[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'purchases?\s+this\s+period[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
+    r'₹\s*([\d,]+\.?\d*)',  # Generic ₹ amount
+    r'rs\.?\s*([\d,]+\.?\d*)',  # Rs. format
+)
+
+# Cheap substring prefilters for the single-field extractors: every
+# pattern in a family requires at least one of these literals, and
+# str.__contains__ is far cheaper than a regex pass, so a family scan is
+# skipped outright when none occur. The last-4 family has no
+# discriminating literal (bare digit runs match), so it is not gated.
+_BILLING_KEYS = ("period", "cycle", "through", "-", "from")
+_DUE_DATE_KEYS = ("due", "pay")
+_COUNT_KEYS = ("transaction",)
+_CHARGE_KEYS = ("total", "charge", "purchase", "₹", "rs")
+
+# One fused alternation per family; each replaces a full-text scan per
+# pattern with a single pass. Used by the individual extract_* methods.
+_LAST4_RE = _FusedPatterns(_LAST4_PATTERNS)
+_BILLING_RE = _FusedPatterns(_BILLING_PATTERNS)
+_DUE_DATE_RE = _FusedPatterns(_DUE_DATE_PATTERNS)
+_BALANCE_RE = _FusedPatterns(_BALANCE_PATTERNS)
+_COUNT_RE = _FusedPatterns(_COUNT_PATTERNS)
+_CHARGE_RE = _FusedPatterns(_CHARGE_PATTERNS)
+
+# For parse() all families fuse into one whole-statement scan, so a full
+# parse touches the text once instead of once per family. Patterns shared
+# between families (the bare ₹/Rs amount fallbacks appear in both the
+# balance and charge lists) are deduplicated so each is matched once and
+# every family that declares it sees the same captures.
+_FAMILIES = (
+    ("last4", _LAST4_PATTERNS),
+    ("billing", _BILLING_PATTERNS),
+    ("due_date", _DUE_DATE_PATTERNS),
+    ("balance", _BALANCE_PATTERNS),
+    ("count", _COUNT_PATTERNS),
+    ("charge", _CHARGE_PATTERNS),
+)
+
+_unique_ids: Dict[str, int] = {}
+for _, _family in _FAMILIES:
+    for _pattern in _family:
+        _unique_ids.setdefault(_pattern, len(_unique_ids))
+_ALL_FIELDS_RE = _FusedPatterns(tuple(_unique_ids))
+
+# Per family: the deduplicated pattern id of each local pattern, in
+# priority order
+_FAMILY_IDS = {
+    name: tuple(_unique_ids[pattern] for pattern in family)
+    for name, family in _FAMILIES
+}
+del _unique_ids, _family, _pattern
+
+
+@lru_cache(maxsize=16)
+def _scan_fields(text: str) -> Dict[str, Dict[int, tuple]]:
+    """Scan the text once and bucket matches by extractor family.
+
+    Memoized on the (lowered) text: the same statement is scanned more
+    than once per upload (completeness probing during early-exit
+    extraction, parse after debug, cache-miss retries). Callers treat the
+    returned buckets as read-only.
+    """
+    found = _ALL_FIELDS_RE.first_matches(text)
+    return {
+        name: {
+            local: found[pattern_id]
+            for local, pattern_id in enumerate(ids)
+            if pattern_id in found
+        }
+        for name, ids in _FAMILY_IDS.items()
+    }
 
 
 class CreditCardParser(ABC):
-    """Base class for credit card statement parsers"""
-    
-    @abstractmethod
+    """Base class for credit card statement parsers.
+
+    The extraction logic is issuer-agnostic; subclasses only pin the
+    issuer name reported in results, so a single parse implementation
+    serves every bank.
+    """
+
+    issuer: str = "Unknown"
+
     def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        """Parse PDF text and extract key data points"""
-        pass
-    
+        """Parse PDF text and extract key data points in one text scan"""
+        fields = _scan_fields(text.lower())
+        digits = _pick_capture(fields["last4"])
+        billing = fields["billing"]
+        due_date = _pick_capture(fields["due_date"])
+        balance = _pick_amount(fields["balance"])
+        count = _pick_capture(fields["count"])
+        charges = _pick_amount(fields["charge"])
+        if billing:
+            start_date, end_date = billing[min(billing)]
+            billing_cycle = {"start_date": start_date, "end_date": end_date}
+        else:
+            billing_cycle = {"start_date": "N/A", "end_date": "N/A"}
+        return {
+            "issuer": self.issuer,
+            "card_last_four_digits": digits if digits else "N/A",
+            "billing_cycle": billing_cycle,
+            "payment_due_date": due_date if due_date else "N/A",
+            "total_balance": balance if balance else "N/A",
+            "transaction_info": {
+                "transaction_count": count if count else "N/A",
+                "total_charges": charges if charges else "N/A"
+            }
+        }
+
     def extract_last_four_digits(self, text: str) -> str:
         """Extract card last 4 digits (Indian and international formats)"""
-        # Common patterns: ****1234, xxxx1234, ending in 1234, card number ending 1234
-        patterns = [
-            r'\*\*\*\*\s*(\d{4})',
-            r'xxxx\s*(\d{4})',
-            r'ending\s+in\s+(\d{4})',
-            r'card\s+ending\s+(\d{4})',
-            r'card\s+number\s+ending\s+(\d{4})',
-            r'(\d{4})\s*ending',
-            r'\b(\d{4})\s*(?:ending|expires)',
-            r'card\s+no[.:]\s*[x*]+\s*(\d{4})',
-            r'[x*]{8,}\s*(\d{4})',  # Multiple x or * followed by 4 digits
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        # Look for patterns like: 1234 5678 9012 3456 (full card number)
-        card_pattern = r'\b\d{4}\s+\d{4}\s+\d{4}\s+(\d{4})\b'
-        match = re.search(card_pattern, text)
-        if match:
-            return match.group(1)
-        
-        # Indian format: Card ending with xxxx-xxxx-xxxx-1234 or similar
-        indian_pattern = r'(?:card|account).*?[-x*\s]+(\d{4})\b'
-        match = re.search(indian_pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        
-        return "N/A"
+        digits = _pick_capture(_LAST4_RE.first_matches(text.lower()))
+        return digits if digits else "N/A"
     
     def extract_billing_cycle(self, text: str) -> Dict[str, str]:
         """Extract billing cycle start and end dates (supports DD/MM/YYYY and MM/DD/YYYY)"""
-        # Common patterns - supporting both US and Indian date formats
-        patterns = [
-            r'billing\s+period[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'statement\s+period[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'billing\s+cycle[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+through\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+-\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',  # Dash separator
-            r'from\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'period[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})\s+to\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return {
-                    "start_date": match.group(1),
-                    "end_date": match.group(2)
-                }
-        
+        text_lc = text.lower()
+        if not any(key in text_lc for key in _BILLING_KEYS):
+            return {"start_date": "N/A", "end_date": "N/A"}
+        found = _BILLING_RE.first_matches(text_lc)
+        if found:
+            start_date, end_date = found[min(found)]
+            return {
+                "start_date": start_date,
+                "end_date": end_date
+            }
+
         return {"start_date": "N/A", "end_date": "N/A"}
     
     def extract_payment_due_date(self, text: str) -> str:
         """Extract payment due date (supports DD/MM/YYYY and MM/DD/YYYY)"""
-        patterns = [
-            r'payment\s+due\s+date[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'due\s+date[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'minimum\s+payment\s+due\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'pay\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'payment\s+due\s+on[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'payable\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'payable\s+on\s+or\s+before[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-            r'due\s+by[:\s]+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return "N/A"
+        text_lc = text.lower()
+        if not any(key in text_lc for key in _DUE_DATE_KEYS):
+            return "N/A"
+        due_date = _pick_capture(_DUE_DATE_RE.first_matches(text_lc))
+        return due_date if due_date else "N/A"
     
     def extract_total_balance(self, text: str) -> str:
         """Extract total balance/amount due (supports both ₹ and $, Indian formats)"""
-        patterns = [
-            r'total\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'new\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'current\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'outstanding\s+balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'amount\s+due[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'total\s+amount\s+due[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'outstanding\s+amount[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'balance\s+amount[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'balance[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'₹\s*([\d,]+\.?\d*)',  # Just ₹ symbol followed by amount
-            r'rupees?\s*([\d,]+\.?\d*)',  # Indian: "Rupees" or "Rupee"
-            r'rs\.?\s*([\d,]+\.?\d*)',  # Indian: "Rs." or "Rs"
-            r'inr\s*([\d,]+\.?\d*)',  # INR currency code
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = match.group(1).replace(',', '').replace(' ', '')
-                try:
-                    return f"₹{float(amount):,.2f}"
-                except ValueError:
-                    continue
-        
-        return "N/A"
+        balance = _pick_amount(_BALANCE_RE.first_matches(text.lower()))
+        return balance if balance else "N/A"
     
     def extract_transaction_info(self, text: str) -> Dict[str, Any]:
         """Extract transaction summary (Indian and international formats)"""
+        text_lc = text.lower()
+
         # Try to find transaction count
-        count_patterns = [
-            r'(\d+)\s+transactions?',
-            r'total\s+transactions?[:\s]+(\d+)',
-            r'number\s+of\s+transactions?[:\s]+(\d+)',
-            r'transaction\s+count[:\s]+(\d+)',
-            r'no\.?\s+of\s+transactions?[:\s]+(\d+)',  # Indian: "No. of transactions"
-        ]
-        
         transaction_count = "N/A"
-        for pattern in count_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                transaction_count = match.group(1)
-                break
-        
+        if any(key in text_lc for key in _COUNT_KEYS):
+            count = _pick_capture(_COUNT_RE.first_matches(text_lc))
+            if count:
+                transaction_count = count
+
         # Try to extract total charges (supports both ₹ and $)
-        charge_patterns = [
-            r'total\s+charges?[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'total\s+purchases?[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'total\s+spend[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'total\s+debits?[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'total\s+spending[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'charges?\s+this\s+period[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'purchases?\s+this\s+period[:\s]+[₹$]?\s*([\d,]+\.?\d*)',
-            r'₹\s*([\d,]+\.?\d*)',  # Generic ₹ amount
-            r'rs\.?\s*([\d,]+\.?\d*)',  # Rs. format
-        ]
-        
         total_charges = "N/A"
-        for pattern in charge_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = match.group(1).replace(',', '').replace(' ', '')
-                try:
-                    total_charges = f"₹{float(amount):,.2f}"
-                    break
-                except ValueError:
-                    continue
-        
+        if any(key in text_lc for key in _CHARGE_KEYS):
+            charges = _pick_amount(_CHARGE_RE.first_matches(text_lc))
+            if charges:
+                total_charges = charges
+
         return {
             "transaction_count": transaction_count,
             "total_charges": total_charges
@@ -170,128 +351,90 @@ class CreditCardParser(ABC):
 
 class HDFCParser(CreditCardParser):
     """Parser for HDFC Bank credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "HDFC Bank",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "HDFC Bank"
 
 
 class ICICIParser(CreditCardParser):
     """Parser for ICICI Bank credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "ICICI Bank",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "ICICI Bank"
 
 
 class SBIParser(CreditCardParser):
     """Parser for State Bank of India credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "State Bank of India",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "State Bank of India"
 
 
 class AxisParser(CreditCardParser):
     """Parser for Axis Bank credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "Axis Bank",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "Axis Bank"
 
 
 class KotakParser(CreditCardParser):
     """Parser for Kotak Mahindra Bank credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "Kotak Mahindra Bank",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "Kotak Mahindra Bank"
 
 
 class DCBParser(CreditCardParser):
     """Parser for DCB Bank credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "DCB Bank",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "DCB Bank"
 
 
 class YesBankParser(CreditCardParser):
     """Parser for Yes Bank credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "Yes Bank",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "Yes Bank"
 
 
 class IndusIndParser(CreditCardParser):
     """Parser for IndusInd Bank credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "IndusInd Bank",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
+
+    issuer = "IndusInd Bank"
 
 
 class OneCardParser(CreditCardParser):
     """Parser for OneCard credit card statements"""
-    
-    def parse(self, text: str, pdf_bytes: bytes) -> Dict[str, Any]:
-        return {
-            "issuer": "OneCard",
-            "card_last_four_digits": self.extract_last_four_digits(text),
-            "billing_cycle": self.extract_billing_cycle(text),
-            "payment_due_date": self.extract_payment_due_date(text),
-            "total_balance": self.extract_total_balance(text),
-            "transaction_info": self.extract_transaction_info(text)
-        }
 
+    issuer = "OneCard"
+
+
+# Shared parser registry: one singleton per issuer, aliased under every name
+# detection can produce. Parsers are stateless, so the aliases previously
+# holding separate instances gained nothing from the duplicates.
+_PARSER_ALIASES = (
+    (HDFCParser, ("hdfc", "hdfc bank")),
+    (ICICIParser, ("icici", "icici bank")),
+    (SBIParser, ("sbi", "state bank of india")),
+    (AxisParser, ("axis", "axis bank")),
+    (KotakParser, ("kotak", "kotak mahindra", "kotak mahindra bank")),
+    (DCBParser, ("dcb", "dcb bank", "development credit bank")),
+    (YesBankParser, ("yes bank", "yes")),
+    (IndusIndParser, ("indusind", "indusind bank")),
+    (OneCardParser, ("onecard", "one card")),
+)
+
+PARSERS: Dict[str, CreditCardParser] = {
+    alias: instance
+    for parser_cls, aliases in _PARSER_ALIASES
+    for instance in (parser_cls(),)
+    for alias in aliases
+}
 
+# Human-readable issuer names keyed by the identifiers detection returns
+ISSUER_DISPLAY_NAMES: Dict[str, str] = {
+    "hdfc": "HDFC Bank",
+    "icici": "ICICI Bank",
+    "sbi": "State Bank of India",
+    "axis": "Axis Bank",
+    "kotak": "Kotak Mahindra Bank",
+    "dcb": "DCB Bank",
+    "yes bank": "Yes Bank",
+    "indusind": "IndusInd Bank",
+    "onecard": "OneCard"
+}
 
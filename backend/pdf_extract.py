@@ -0,0 +1,238 @@
+"""Shared PDF text extraction helpers for the API endpoints.
+
+pdfplumber builds char/line/rect/curve object tables on top of pdfminer.six
+that the statement parsers never use - they only need the raw page text for
+issuer detection and field extraction. Calling pdfminer's high-level text
+extraction directly skips all of that per-page object materialization.
+pdfplumber is kept only as a fallback for documents where pdfminer returns
+no text.
+"""
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import pdfplumber
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFEncryptionError
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+
+logger = logging.getLogger(__name__)
+
+# pypdfium2 wraps PDFium (C++), which is roughly an order of magnitude
+# faster than pure-Python pdfminer. It stays optional so the backend still
+# works where the wheel is unavailable.
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# PyMuPDF is a second native extractor, tried when pypdfium2 is missing or
+# chokes on a document; it is similarly fast and tolerates more damage.
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+# Set PDF_USE_PDFIUM=0 to force the pdfminer/pdfplumber path
+USE_PDFIUM = os.getenv("PDF_USE_PDFIUM", "1").lower() not in ("0", "false", "no")
+
+# Opt-in: stop the page-by-page fallback as soon as the issuer and every
+# parsed field are extractable from the accumulated text. Off by default
+# because a field regex can match a provisional value early (e.g. a
+# transaction count mid-statement) that a later page would supersede.
+EARLY_EXIT_EXTRACTION = os.getenv("EARLY_EXIT_EXTRACTION", "").lower() in ("1", "true", "yes")
+
+
+class PDFPasswordError(Exception):
+    """Raised when a PDF is encrypted and the password is missing or wrong."""
+    pass
+
+
+def _extract_with_fitz(contents: bytes, password: Optional[str]) -> Tuple[str, int]:
+    """Extraction via PyMuPDF (native MuPDF)"""
+    doc = fitz.open(stream=contents, filetype="pdf")
+    try:
+        if doc.needs_pass:
+            if not password or not doc.authenticate(password):
+                raise PDFPasswordError("PDF is encrypted and the password is missing or incorrect")
+        page_count = doc.page_count
+        text = "".join(page.get_text() + "\n" for page in doc)
+    finally:
+        doc.close()
+    return text, page_count
+
+
+def _extract_with_pdfminer(contents: bytes, password: Optional[str]) -> Tuple[str, int]:
+    """Extract text and count pages with pdfminer in a single document pass"""
+    output = io.StringIO()
+    rsrcmgr = PDFResourceManager()
+    device = TextConverter(rsrcmgr, output, laparams=LAParams())
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    page_count = 0
+    with io.BytesIO(contents) as fp:
+        for page in PDFPage.get_pages(fp, password=password or ""):
+            interpreter.process_page(page)
+            page_count += 1
+    device.close()
+    return output.getvalue(), page_count
+
+
+def _extract_with_pdfium(contents: bytes, password: Optional[str]) -> Tuple[str, int]:
+    """Primary extraction via pypdfium2 (native PDFium)"""
+    doc = pdfium.PdfDocument(contents, password=password or None)
+    try:
+        page_count = len(doc)
+        text = "".join(page.get_textpage().get_text_range() + "\n" for page in doc)
+    finally:
+        doc.close()
+    return text, page_count
+
+
+# Page ranges are only farmed out to worker processes when the document is
+# large enough to amortize process startup. pdfplumber sits on pure-Python
+# pdfminer, so threads would just contend on the GIL.
+PARALLEL_PAGE_THRESHOLD = 8
+_PAGE_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _pdfplumber_range_text(contents: bytes, password: Optional[str], start: int, stop: int) -> List[str]:
+    """Extract text for a half-open page range; runs in a worker process"""
+    with pdfplumber.open(io.BytesIO(contents), password=password) as pdf_doc:
+        page_texts = []
+        for page in pdf_doc.pages[start:stop]:
+            try:
+                page_texts.append(page.extract_text_simple() or "")
+            except Exception:
+                page_texts.append("")
+        return page_texts
+
+
+def _statement_complete(text: str) -> bool:
+    """True when the issuer and every parsed field resolve from the text so far"""
+    # Imported lazily: this module is the low-level layer and only needs the
+    # parsers when the opt-in early exit is enabled
+    from issuer_detect import detect_issuer
+    from parsers import PARSERS
+
+    issuer = detect_issuer(text)
+    parser = PARSERS.get(issuer)
+    if parser is None:
+        return False
+    result = parser.parse(text, b"")
+    billing = result["billing_cycle"]
+    transactions = result["transaction_info"]
+    return (
+        result["card_last_four_digits"] != "N/A"
+        and result["payment_due_date"] != "N/A"
+        and result["total_balance"] != "N/A"
+        and billing["start_date"] != "N/A"
+        and billing["end_date"] != "N/A"
+        and transactions["transaction_count"] != "N/A"
+        and transactions["total_charges"] != "N/A"
+    )
+
+
+def _extract_with_pdfplumber(contents: bytes, password: Optional[str]) -> Tuple[str, int]:
+    """Fallback extraction via pdfplumber for PDFs pdfminer can't handle"""
+    page_texts = []
+    pdf_bytes = io.BytesIO(contents)
+    if password:
+        pdf_doc = pdfplumber.open(pdf_bytes, password=password)
+    else:
+        pdf_doc = pdfplumber.open(pdf_bytes)
+    try:
+        page_count = len(pdf_doc.pages)
+
+        if page_count >= PARALLEL_PAGE_THRESHOLD and _PAGE_POOL_WORKERS > 1:
+            pdf_doc.close()
+            try:
+                return _extract_pages_parallel(contents, password, page_count), page_count
+            except Exception:
+                # Worker pool failed (e.g. restricted environment) - reopen
+                # and fall through to the serial loop
+                pdf_bytes.seek(0)
+                pdf_doc = pdfplumber.open(pdf_bytes, password=password)
+
+        for page_num, page in enumerate(pdf_doc.pages, 1):
+            try:
+                # The parsers only regex the raw text, so skip the slower
+                # word-clustering layout pass of extract_text()
+                page_text = page.extract_text_simple()
+            except Exception as page_error:
+                # Log but continue with other pages
+                error_detail = str(page_error) or type(page_error).__name__
+                logger.warning("Could not extract text from page %d: %s", page_num, error_detail)
+                continue
+            if page_text:
+                page_texts.append(page_text)
+                # Outside the try above: a failing completeness probe should
+                # surface, not get logged as a page-extraction failure
+                if EARLY_EXIT_EXTRACTION and page_num < page_count and \
+                        _statement_complete("".join(text + "\n" for text in page_texts)):
+                    logger.info("Early exit after page %d of %d", page_num, page_count)
+                    break
+    finally:
+        pdf_doc.close()
+    return "".join(text + "\n" for text in page_texts), page_count
+
+
+def _extract_pages_parallel(contents: bytes, password: Optional[str], page_count: int) -> str:
+    """Split the document's pages across worker processes and join the text"""
+    step = -(-page_count // _PAGE_POOL_WORKERS)  # ceil division
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        chunks = pool.map(
+            _pdfplumber_range_text,
+            (contents for _ in ranges),
+            (password for _ in ranges),
+            (start for start, _ in ranges),
+            (stop for _, stop in ranges),
+        )
+        page_texts = [text for chunk in chunks for text in chunk]
+    return "".join(text + "\n" for text in page_texts if text)
+
+
+def extract_text_and_pages(contents: bytes, password: Optional[str] = None) -> Tuple[str, int]:
+    """Extract full text and page count from PDF bytes.
+
+    Uses pypdfium2 when available, then pdfminer.six, falling back to
+    pdfplumber when neither produces text. Raises PDFPasswordError when the
+    PDF is encrypted and the password is missing or incorrect.
+    """
+    if USE_PDFIUM and pdfium is not None:
+        try:
+            text, page_count = _extract_with_pdfium(contents, password)
+            if text.strip():
+                return text, page_count
+        except pdfium.PdfiumError as e:
+            if "password" in str(e).lower():
+                raise PDFPasswordError(str(e)) from e
+            # Malformed for PDFium - let the next backend have a go
+        except Exception:
+            pass
+
+    if fitz is not None:
+        try:
+            text, page_count = _extract_with_fitz(contents, password)
+            if text.strip():
+                return text, page_count
+        except PDFPasswordError:
+            raise
+        except Exception:
+            pass
+
+    try:
+        text, page_count = _extract_with_pdfminer(contents, password)
+    except PDFEncryptionError as e:
+        # Covers PDFPasswordIncorrect and unsupported encryption schemes
+        raise PDFPasswordError(str(e) or type(e).__name__) from e
+
+    if not text or not text.strip():
+        # pdfminer found nothing - retry with pdfplumber before giving up
+        text, page_count = _extract_with_pdfplumber(contents, password)
+
+    return text, page_count
@@ -3,9 +3,8 @@ SureFinance - Credit Card Statement Parser & Generator
 A Streamlit app for parsing and generating credit card statements
 """
 import streamlit as st
-import pdfplumber
+import hashlib
 import io
-import re
 import json
 import csv
 from datetime import datetime, timedelta
@@ -13,21 +12,18 @@ from typing import Dict, Any
 import sys
 import os
 
+# orjson serializes roughly an order of magnitude faster than the stdlib
+# encoder and returns bytes directly; fall back gracefully when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add backend directory to path to import parsers
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
-from parsers import (
-    CreditCardParser, HDFCParser, ICICIParser, SBIParser, 
-    AxisParser, KotakParser, DCBParser, YesBankParser, 
-    IndusIndParser, OneCardParser
-)
-
-# Import PDF generation from reportlab
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from issuer_detect import detect_issuer
+from pdf_extract import extract_text_and_pages, PDFPasswordError
+from parsers import ISSUER_DISPLAY_NAMES, PARSERS
 
 # Configure Streamlit page
 st.set_page_config(
@@ -42,30 +38,18 @@ if 'parsed_data' not in st.session_state:
     st.session_state.parsed_data = None
 if 'parsed_filename' not in st.session_state:
     st.session_state.parsed_filename = None
+# Parse results keyed by (content hash, password) - re-parsing the same
+# upload skips extraction and field scanning entirely. Hashing the bytes is
+# orders of magnitude cheaper than one pdfplumber page.
+if 'parse_cache' not in st.session_state:
+    st.session_state.parse_cache = {}
+# Extracted text keyed by content hash alone: a re-parse of the same upload
+# with a different password (or after a cleared result cache) reuses the
+# expensive extraction and only re-runs the cheap regex pass
+if 'text_cache' not in st.session_state:
+    st.session_state.text_cache = {}
 
-# Map parsers to issuer names
-PARSERS: Dict[str, CreditCardParser] = {
-    "hdfc": HDFCParser(),
-    "hdfc bank": HDFCParser(),
-    "icici": ICICIParser(),
-    "icici bank": ICICIParser(),
-    "sbi": SBIParser(),
-    "state bank of india": SBIParser(),
-    "axis": AxisParser(),
-    "axis bank": AxisParser(),
-    "kotak": KotakParser(),
-    "kotak mahindra": KotakParser(),
-    "kotak mahindra bank": KotakParser(),
-    "dcb": DCBParser(),
-    "dcb bank": DCBParser(),
-    "development credit bank": DCBParser(),
-    "yes bank": YesBankParser(),
-    "yes": YesBankParser(),
-    "indusind": IndusIndParser(),
-    "indusind bank": IndusIndParser(),
-    "onecard": OneCardParser(),
-    "one card": OneCardParser(),
-}
+_PARSE_CACHE_LIMIT = 32
 
 SUPPORTED_BANKS = [
     "HDFC Bank",
@@ -80,32 +64,6 @@ SUPPORTED_BANKS = [
 ]
 
 
-def detect_issuer(text: str) -> str:
-    """Detect credit card issuer from PDF text"""
-    text_lower = text.lower()
-    
-    if "development credit bank" in text_lower or ("dcb bank" in text_lower and "dcb" in text_lower):
-        return "dcb"
-    elif "hdfc bank" in text_lower or ("hdfc" in text_lower and "housing development finance" not in text_lower):
-        return "hdfc"
-    elif "icici bank" in text_lower or "icici" in text_lower:
-        return "icici"
-    elif "state bank of india" in text_lower or ("sbi" in text_lower and "state" in text_lower):
-        return "sbi"
-    elif "axis bank" in text_lower or "axis" in text_lower:
-        return "axis"
-    elif "kotak mahindra bank" in text_lower or "kotak mahindra" in text_lower or "kotak" in text_lower:
-        return "kotak"
-    elif "yes bank" in text_lower:
-        return "yes bank"
-    elif "indusind bank" in text_lower or "indusind" in text_lower:
-        return "indusind"
-    elif "onecard" in text_lower or "one card" in text_lower:
-        return "onecard"
-    
-    return "unknown"
-
-
 def calculate_confidence_scores(result: Dict[str, Any]) -> Dict[str, float]:
     """Calculate confidence scores for extracted data points"""
     scores = {}
@@ -138,12 +96,22 @@ def calculate_confidence_scores(result: Dict[str, Any]) -> Dict[str, float]:
     else:
         scores["transaction_info"] = 0.0
     
-    non_overall_scores = [v for k, v in scores.items() if k != "overall"]
-    scores["overall"] = sum(non_overall_scores) / len(non_overall_scores) if non_overall_scores else 0.0
-    
+    # The field keys are fixed, so average them directly instead of
+    # filtering the dict through an intermediate list
+    scores["overall"] = (
+        scores["card_last_four_digits"] + scores["billing_cycle"] +
+        scores["payment_due_date"] + scores["total_balance"] +
+        scores["transaction_info"]
+    ) / 5.0
+
     return scores
 
 
+# Strips currency symbols, separators and whitespace from amount strings in
+# one C-level table pass with no intermediate string copies
+_CURRENCY_STRIP = str.maketrans("", "", "₹$, \t\n\r\u00a0")
+
+
 def generate_analytics(result: Dict[str, Any]) -> Dict[str, Any]:
     """Generate analytics and insights from parsed data"""
     analytics = {
@@ -155,7 +123,7 @@ def generate_analytics(result: Dict[str, Any]) -> Dict[str, Any]:
     balance_str = result.get("total_balance", "N/A")
     if balance_str != "N/A":
         try:
-            balance = float(balance_str.replace("₹", "").replace("$", "").replace(",", "").replace(" ", ""))
+            balance = float(balance_str.translate(_CURRENCY_STRIP))
             analytics["spending_insights"]["current_balance"] = balance
             
             if balance > 5000:
@@ -186,24 +154,22 @@ def generate_analytics(result: Dict[str, Any]) -> Dict[str, Any]:
     return analytics
 
 
-def parse_pdf(file_bytes: bytes, password: str = None) -> Dict[str, Any]:
+def parse_pdf(file_bytes: bytes, password: str = None, content_hash: str = None) -> Dict[str, Any]:
     """Parse PDF and extract credit card statement data"""
-    pdf_text = ""
-    pdf_bytes = io.BytesIO(file_bytes)
-    
     try:
-        if password:
-            pdf_doc = pdfplumber.open(pdf_bytes, password=password.strip())
-        else:
-            pdf_doc = pdfplumber.open(pdf_bytes)
-        
-        for page in pdf_doc.pages:
-            page_text = page.extract_text()
-            if page_text:
-                pdf_text += page_text + "\n"
-        
-        pdf_doc.close()
-        
+        if content_hash is None:
+            content_hash = hashlib.sha256(file_bytes).hexdigest()
+        pdf_text = st.session_state.text_cache.get(content_hash)
+        if pdf_text is None:
+            # Shared extraction chain from the backend: native
+            # pypdfium2/PyMuPDF first, pdfminer/pdfplumber as fallbacks
+            pdf_text, _page_count = extract_text_and_pages(
+                file_bytes, password.strip() if password else None
+            )
+            if len(st.session_state.text_cache) >= _PARSE_CACHE_LIMIT:
+                st.session_state.text_cache.clear()
+            st.session_state.text_cache[content_hash] = pdf_text
+
         if not pdf_text or len(pdf_text.strip()) == 0:
             raise ValueError("Could not extract text from PDF. The PDF might be image-based (scanned) or encrypted.")
         
@@ -221,18 +187,7 @@ def parse_pdf(file_bytes: bytes, password: str = None) -> Dict[str, Any]:
         # Parse statement
         result = parser.parse(pdf_text, file_bytes)
         
-        issuer_display_names = {
-            "hdfc": "HDFC Bank",
-            "icici": "ICICI Bank",
-            "sbi": "State Bank of India",
-            "axis": "Axis Bank",
-            "kotak": "Kotak Mahindra Bank",
-            "dcb": "DCB Bank",
-            "yes bank": "Yes Bank",
-            "indusind": "IndusInd Bank",
-            "onecard": "OneCard"
-        }
-        result["detected_issuer"] = issuer_display_names.get(issuer, issuer.title())
+        result["detected_issuer"] = ISSUER_DISPLAY_NAMES.get(issuer, issuer.title())
         result["confidence_scores"] = calculate_confidence_scores(result)
         result["extraction_metadata"] = {
             "extracted_at": datetime.now().isoformat(),
@@ -242,52 +197,133 @@ def parse_pdf(file_bytes: bytes, password: str = None) -> Dict[str, Any]:
         
         return result
         
+    except PDFPasswordError:
+        raise Exception("Error parsing PDF: the PDF is password-protected or the password is incorrect.")
     except Exception as e:
         raise Exception(f"Error parsing PDF: {str(e)}")
 
 
-def create_sample_statement() -> bytes:
-    """Create a sample credit card statement PDF"""
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    story = []
-    
-    styles = getSampleStyleSheet()
-    
+# ReportLab is only needed on the "Generate Sample PDF" page, so import it
+# on first use rather than slowing every script run down; the styles are
+# static, so build them once alongside the import and reuse them.
+@st.cache_resource(show_spinner=False)
+def _reportlab_styles() -> Dict[str, Any]:
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    sheet = getSampleStyleSheet()
+
     title_style = ParagraphStyle(
         'CustomTitle',
-        parent=styles['Heading1'],
+        parent=sheet['Heading1'],
         fontSize=24,
         textColor=colors.HexColor('#1a56db'),
         spaceAfter=30,
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
     )
-    
+
     header_style = ParagraphStyle(
         'CustomHeader',
-        parent=styles['Heading2'],
+        parent=sheet['Heading2'],
         fontSize=14,
         textColor=colors.HexColor('#1f2937'),
         spaceAfter=10,
         alignment=TA_LEFT,
         fontName='Helvetica-Bold'
     )
-    
+
     normal_style = ParagraphStyle(
         'CustomNormal',
-        parent=styles['Normal'],
+        parent=sheet['Normal'],
         fontSize=11,
         textColor=colors.HexColor('#374151'),
         alignment=TA_LEFT,
         fontName='Helvetica'
     )
-    
+
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=sheet['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#6b7280'),
+        alignment=TA_CENTER,
+        fontName='Helvetica-Oblique'
+    )
+
+    account_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f3f4f6')),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1f2937')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
+    ])
+
+    tx_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a56db')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('TOPPADDING', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+        ('TOPPADDING', (0, 1), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),
+    ])
+
+    summary_table_style = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('FONTNAME', (0, 6), (-1, 6), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 6), (-1, 6), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -2), 1, colors.HexColor('#e5e7eb')),
+        ('LINEABOVE', (0, 6), (-1, 6), 2, colors.HexColor('#1f2937')),
+    ])
+
+    return {
+        'title': title_style,
+        'header': header_style,
+        'normal': normal_style,
+        'footer': footer_style,
+        'account_table': account_table_style,
+        'tx_table': tx_table_style,
+        'summary_table': summary_table_style,
+    }
+
+
+# The sample statement only varies with the current month's billing dates,
+# so cache the built PDF for a day and make repeat clicks free
+@st.cache_data(ttl=86400, show_spinner=False)
+def create_sample_statement() -> bytes:
+    """Create a sample credit card statement PDF"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+
+    styles = _reportlab_styles()
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    story = []
+
     end_date = datetime.now().replace(day=1) - timedelta(days=1)
     start_date = (end_date.replace(day=1) - timedelta(days=1)).replace(day=1)
     due_date = end_date + timedelta(days=25)
     
-    title = Paragraph("CHASE", title_style)
+    title = Paragraph("CHASE", styles['title'])
     story.append(title)
     story.append(Spacer(1, 0.2*inch))
     
@@ -300,33 +336,23 @@ def create_sample_statement() -> bytes:
     ]
     
     account_table = Table(account_info_data, colWidths=[2*inch, 3*inch])
-    account_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f3f4f6')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1f2937')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
-    ]))
+    account_table.setStyle(styles['account_table'])
     
-    story.append(Paragraph("Account Summary", header_style))
+    story.append(Paragraph("Account Summary", styles['header']))
     story.append(Spacer(1, 0.1*inch))
     story.append(account_table)
     story.append(Spacer(1, 0.3*inch))
     
     billing_text = f"Billing Cycle: {start_date.strftime('%m/%d/%Y')} through {end_date.strftime('%m/%d/%Y')}"
-    billing_info = Paragraph(f"<b>{billing_text}</b>", normal_style)
+    billing_info = Paragraph(f"<b>{billing_text}</b>", styles['normal'])
     story.append(billing_info)
     story.append(Spacer(1, 0.2*inch))
     
-    due_date_text = Paragraph(f"Payment Due Date: {due_date.strftime('%m/%d/%Y')}", normal_style)
+    due_date_text = Paragraph(f"Payment Due Date: {due_date.strftime('%m/%d/%Y')}", styles['normal'])
     story.append(due_date_text)
     story.append(Spacer(1, 0.1*inch))
     
-    statement_period = Paragraph(f"Statement Period: {start_date.strftime('%m/%d/%Y')} to {end_date.strftime('%m/%d/%Y')}", normal_style)
+    statement_period = Paragraph(f"Statement Period: {start_date.strftime('%m/%d/%Y')} to {end_date.strftime('%m/%d/%Y')}", styles['normal'])
     story.append(statement_period)
     story.append(Spacer(1, 0.1*inch))
     
@@ -345,23 +371,9 @@ def create_sample_statement() -> bytes:
     ]
     
     transaction_table = Table(transactions, colWidths=[1.2*inch, 3.5*inch, 1.3*inch])
-    transaction_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a56db')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        ('TOPPADDING', (0, 1), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),
-    ]))
+    transaction_table.setStyle(styles['tx_table'])
     
-    story.append(Paragraph("Recent Transactions", header_style))
+    story.append(Paragraph("Recent Transactions", styles['header']))
     story.append(Spacer(1, 0.1*inch))
     story.append(transaction_table)
     story.append(Spacer(1, 0.3*inch))
@@ -378,37 +390,19 @@ def create_sample_statement() -> bytes:
     ]
     
     summary_table = Table(summary_data, colWidths=[2.5*inch, 2.5*inch])
-    summary_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('FONTNAME', (0, 6), (-1, 6), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 6), (-1, 6), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -2), 1, colors.HexColor('#e5e7eb')),
-        ('LINEABOVE', (0, 6), (-1, 6), 2, colors.HexColor('#1f2937')),
-    ]))
+    summary_table.setStyle(styles['summary_table'])
     
-    story.append(Paragraph("Statement Summary", header_style))
+    story.append(Paragraph("Statement Summary", styles['header']))
     story.append(Spacer(1, 0.1*inch))
     story.append(summary_table)
     
     story.append(Spacer(1, 0.2*inch))
-    transaction_count_text = Paragraph("Total Transactions: 10", normal_style)
+    transaction_count_text = Paragraph("Total Transactions: 10", styles['normal'])
     story.append(transaction_count_text)
-    
+
     footer = Paragraph(
         "<i>This is a sample statement for testing purposes. Card ending in 4532.</i>",
-        ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#6b7280'),
-            alignment=TA_CENTER,
-            fontName='Helvetica-Oblique'
-        )
+        styles['footer']
     )
     story.append(footer)
     
@@ -421,34 +415,34 @@ def export_to_csv(data: Dict[str, Any]) -> str:
     """Export parsed data to CSV format"""
     output = io.StringIO()
     writer = csv.writer(output)
-    
-    writer.writerow(["Credit Card Statement Data"])
-    writer.writerow(["Extracted:", data.get("extraction_metadata", {}).get("extracted_at", datetime.now().isoformat())])
-    writer.writerow([])
-    
-    writer.writerow(["Field", "Value"])
-    writer.writerow(["Issuer", data.get("detected_issuer", "N/A")])
-    writer.writerow(["Card Last 4 Digits", data.get("card_last_four_digits", "N/A")])
-    writer.writerow(["Payment Due Date", data.get("payment_due_date", "N/A")])
-    writer.writerow(["Total Balance", data.get("total_balance", "N/A")])
-    
+
     billing = data.get("billing_cycle", {})
-    writer.writerow(["Billing Start", billing.get("start_date", "N/A")])
-    writer.writerow(["Billing End", billing.get("end_date", "N/A")])
-    
     tx_info = data.get("transaction_info", {})
-    writer.writerow(["Transaction Count", tx_info.get("transaction_count", "N/A")])
-    writer.writerow(["Total Charges", tx_info.get("total_charges", "N/A")])
-    
+    rows = [
+        ["Credit Card Statement Data"],
+        ["Extracted:", data.get("extraction_metadata", {}).get("extracted_at", datetime.now().isoformat())],
+        [],
+        ["Field", "Value"],
+        ["Issuer", data.get("detected_issuer", "N/A")],
+        ["Card Last 4 Digits", data.get("card_last_four_digits", "N/A")],
+        ["Payment Due Date", data.get("payment_due_date", "N/A")],
+        ["Total Balance", data.get("total_balance", "N/A")],
+        ["Billing Start", billing.get("start_date", "N/A")],
+        ["Billing End", billing.get("end_date", "N/A")],
+        ["Transaction Count", tx_info.get("transaction_count", "N/A")],
+        ["Total Charges", tx_info.get("total_charges", "N/A")],
+    ]
+
     if data.get("confidence_scores"):
-        writer.writerow([])
-        writer.writerow(["Confidence Scores"])
         scores = data["confidence_scores"]
-        for key, value in scores.items():
-            if key != "overall":
-                writer.writerow([key.replace("_", " ").title(), f"{value * 100:.1f}%"])
-        writer.writerow(["Overall", f"{scores.get('overall', 0) * 100:.1f}%"])
-    
+        rows += [[], ["Confidence Scores"]]
+        rows += [
+            [key.replace("_", " ").title(), f"{value * 100:.1f}%"]
+            for key, value in scores.items() if key != "overall"
+        ]
+        rows.append(["Overall", f"{scores.get('overall', 0) * 100:.1f}%"])
+
+    writer.writerows(rows)
     return output.getvalue()
 
 
@@ -482,15 +476,25 @@ if page == "📄 Parse Statement":
         if st.button("🔍 Parse Statement", type="primary", use_container_width=True):
             with st.spinner("Parsing PDF... Please wait."):
                 try:
-                    file_bytes = uploaded_file.read()
-                    
+                    # getvalue() hands back the upload buffer's bytes without
+                    # the seek/read bookkeeping and is safe to call again on a
+                    # rerun, where read() would return b'' at EOF
+                    file_bytes = uploaded_file.getvalue()
+
                     # Validate PDF
                     if len(file_bytes) == 0:
                         st.error("PDF file is empty")
-                    elif file_bytes[:4] != b'%PDF':
+                    elif not file_bytes.startswith(b'%PDF'):
                         st.error("Invalid PDF file format")
                     else:
-                        result = parse_pdf(file_bytes, password if password else None)
+                        cache_key = (hashlib.sha256(file_bytes).hexdigest(), password or "")
+                        result = st.session_state.parse_cache.get(cache_key)
+                        if result is None:
+                            result = parse_pdf(file_bytes, password if password else None,
+                                               content_hash=cache_key[0])
+                            if len(st.session_state.parse_cache) >= _PARSE_CACHE_LIMIT:
+                                st.session_state.parse_cache.clear()
+                            st.session_state.parse_cache[cache_key] = result
                         st.session_state.parsed_data = result
                         st.session_state.parsed_filename = uploaded_file.name
                         st.success("✅ Statement parsed successfully!")
@@ -563,7 +567,10 @@ if page == "📄 Parse Statement":
             )
         
         with export_col2:
-            json_data = json.dumps(data, indent=2)
+            if orjson is not None:
+                json_data = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                json_data = json.dumps(data, indent=2)
             st.download_button(
                 label="📥 Download as JSON",
                 data=json_data,
@@ -626,7 +633,7 @@ elif page == "ℹ️ About":
     
     #### Technology Stack:
     - **Streamlit** for the web interface
-    - **PDFPlumber** for PDF text extraction
+    - **pypdfium2 / PyMuPDF** for PDF text extraction
     - **ReportLab** for PDF generation
     - **Python** for parsing logic
     